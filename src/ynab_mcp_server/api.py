@@ -11,25 +11,98 @@ YNAB API Documentation: https://api.ynab.com/
 """
 
 import os
-from typing import Optional, Dict, Any, List
+import time
+import random
+import asyncio
+import functools
+from contextlib import aclosing
+from types import ModuleType
+from typing import Optional, Dict, Any, List, Tuple, AsyncGenerator, Callable, NoReturn
 
 import httpx
 
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # fall back to stdlib json (also accepts bytes)
+    from json import dumps as json_dumps, loads as json_loads  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # fall back to parsing whole responses
+    ijson = None  # type: ignore[assignment]
+
 # ============================================================================
 # CONFIGURATION - The only external endpoint this code contacts
 # ============================================================================
 
 YNAB_API_BASE = "https://api.ynab.com/v1"
 REQUEST_TIMEOUT = 30.0  # seconds
+CONNECT_TIMEOUT = 5.0  # seconds; fail fast if api.ynab.com is unreachable
+
+# Single-host connection pool; keep idle TLS connections warm between tool calls
+MAX_CONNECTIONS = 10
+KEEPALIVE_EXPIRY = 300.0  # seconds
+
+# Retry policy for rate limits (429) and transient server errors (5xx)
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0  # seconds
+RETRY_JITTER = 0.5  # up to +50% random jitter
+RETRY_MAX_DELAY = 30.0  # seconds
+
+# YNAB allows 200 requests per rolling hour per token. A bucket lets through at
+# most capacity + refill * 3600 requests in any hour, so the two are sized to sum to 200.
+RATE_LIMIT_PER_HOUR = 200
+RATE_LIMIT_CAPACITY = 20  # burst for multi-request tools like ynab_get_snapshot
+RATE_LIMIT_REFILL = (RATE_LIMIT_PER_HOUR - RATE_LIMIT_CAPACITY) / 3600  # tokens per second
+
+# In-memory cache for GET responses; month and transaction data go stale faster,
+# while payee lists are large and rarely change
+CACHE_TTL = 30.0  # seconds
+CACHE_TTL_VOLATILE = 5.0  # seconds
+CACHE_TTL_PAYEES = 60.0  # seconds
+
+# Creates queued while another create for the budget is in flight are sent
+# together as one bulk POST of at most this many transactions
+CREATE_BATCH_MAX = 50
+
+# Bulk create failures that reject the request outright; the batch's transactions
+# are then resent one by one. 401/403/429 would fail every item the same way.
+_PER_ITEM_RETRY_STATUSES = frozenset({400, 404, 409, 422})
+
+
+# User-facing messages for common API errors, given YNAB's error detail
+_ERROR_MESSAGES: Dict[int, Callable[[str], str]] = {
+    401: lambda detail: "Invalid or expired API token. Please update your token.",
+    403: lambda detail: f"Permission denied: {detail}",
+    404: lambda detail: f"Resource not found: {detail}",
+    429: lambda detail: "Rate limit exceeded. Please wait before making more requests.",
+}
 
 
 # ============================================================================
 # TOKEN MANAGEMENT
 # ============================================================================
 
-def get_token() -> str:
+_keyring: Optional[ModuleType] = None
+_keyring_tried = False
+
+
+def _get_keyring() -> Optional[ModuleType]:
+    """Import the keyring package once. Returns None if it isn't installed."""
+    global _keyring, _keyring_tried
+    if not _keyring_tried:
+        _keyring_tried = True
+        try:
+            import keyring
+            _keyring = keyring
+        except ImportError:
+            pass  # keyring not installed
+    return _keyring
+
+
+def read_token() -> str:
     """
-    Retrieve YNAB API token from secure storage.
+    Read YNAB API token from secure storage, bypassing the cache.
     
     Priority:
     1. Environment variable YNAB_API_TOKEN
@@ -44,15 +117,14 @@ def get_token() -> str:
         return token
     
     # Try keyring if available
-    try:
-        import keyring
-        token = keyring.get_password("ynab-mcp-server", "api_token")
-        if token:
-            return token
-    except ImportError:
-        pass  # keyring not installed
-    except Exception:
-        pass  # keyring error (e.g., no backend)
+    keyring = _get_keyring()
+    if keyring is not None:
+        try:
+            token = keyring.get_password("ynab-mcp-server", "api_token")
+            if token:
+                return token
+        except Exception:
+            pass  # keyring error (e.g., no backend)
     
     raise ValueError(
         "YNAB API token not found. Set YNAB_API_TOKEN environment variable "
@@ -60,6 +132,20 @@ def get_token() -> str:
     )
 
 
+@functools.lru_cache(maxsize=1)
+def get_token() -> str:
+    """
+    Retrieve YNAB API token, reading storage only on first use.
+    
+    Keyring lookups can be slow, so the result of ``read_token`` is cached
+    for the life of the process. ``store_token`` and 401 responses clear it.
+    
+    Raises:
+        ValueError: If no token is found
+    """
+    return read_token()
+
+
 def store_token(token: str) -> bool:
     """
     Store YNAB API token in OS keyring.
@@ -70,18 +156,67 @@ def store_token(token: str) -> bool:
     Returns:
         True if stored successfully, False otherwise
     """
+    keyring = _get_keyring()
+    if keyring is None:
+        print("Error: keyring package not installed. Install with: pip install keyring")
+        return False
+    
     try:
-        import keyring
         keyring.set_password("ynab-mcp-server", "api_token", token)
+        get_token.cache_clear()
         return True
-    except ImportError:
-        print("Error: keyring package not installed. Install with: pip install keyring")
-        return False
     except Exception as e:
         print(f"Error storing token: {e}")
         return False
 
 
+# ============================================================================
+# RATE LIMITING
+# ============================================================================
+
+class _RateLimiter:
+    """Token bucket that keeps us under YNAB's quota instead of hitting 429s."""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request token is available, then take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.last_refill) * self.refill_rate,
+                )
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.refill_rate)
+
+
+def _created_key(transaction: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Fields YNAB echoes back unchanged, used to match bulk-created transactions to requests."""
+    return (transaction["account_id"], transaction["date"], transaction["amount"])
+
+
+class _AsyncByteReader:
+    """Expose a streaming httpx response as the async file object ijson reads from."""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b""  # ijson probes with read(0) to detect bytes vs str
+        return await anext(self._chunks, b"")
+
+
 # ============================================================================
 # API CLIENT
 # ============================================================================
@@ -96,32 +231,51 @@ class YNABClient:
     - Handle errors consistently
     """
 
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None, cache_ttl: float = CACHE_TTL):
         """
         Initialize YNAB client.
         
         Args:
             token: Optional API token. If not provided, retrieved from secure storage.
+            cache_ttl: Seconds to cache GET responses. 0 disables caching.
+                Otherwise month and transaction reads are capped at
+                CACHE_TTL_VOLATILE, and payee lists are kept for at least
+                CACHE_TTL_PAYEES.
         """
+        self._token_from_storage = token is None
         self._token = token or get_token()
-        self._client: Optional[httpx.AsyncClient] = None
-    
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=YNAB_API_BASE,
-                headers={
-                    "Authorization": f"Bearer {self._token}",
-                    "Content-Type": "application/json",
-                },
-                timeout=REQUEST_TIMEOUT,
-            )
-        return self._client
+        self._headers = {
+            "Authorization": f"Bearer {self._token}",
+            "Content-Type": "application/json",
+        }
+        # One long-lived HTTP client; it is only closed on shutdown via close()
+        self._client = httpx.AsyncClient(
+            base_url=YNAB_API_BASE,
+            headers=self._headers,
+            timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            http2=True,
+        )
+        self._limiter = _RateLimiter(RATE_LIMIT_CAPACITY, RATE_LIMIT_REFILL)
+        self._cache_ttl = cache_ttl
+        self._cache: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Tuple[float, Dict[str, Any]]] = {}
+        self._inflight: Dict[Tuple[Any, ...], Tuple[asyncio.Future, int]] = {}
+        self._write_gen = 0  # bumped around every write; see _invalidate()
+        self._pending_creates: Dict[str, List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+        self._creating: set = set()  # budget IDs with a create request in flight
+        self._flush_tasks: set = set()
     
     async def close(self):
-        """Close HTTP client."""
-        if self._client and not self._client.is_closed:
+        """Send any queued transaction creates, then close the HTTP client."""
+        for budget_id in list(self._pending_creates):  # don't wait on the create ahead of them
+            self._flush_next(budget_id)
+        while self._flush_tasks:  # a finished flush may start the next batch
+            await asyncio.gather(*list(self._flush_tasks), return_exceptions=True)
+        if not self._client.is_closed:
             await self._client.aclose()
     
     async def __aenter__(self):
@@ -138,6 +292,7 @@ class YNABClient:
         endpoint: str, 
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        fresh: bool = False,
     ) -> Dict[str, Any]:
         """
         Make API request to YNAB.
@@ -147,6 +302,7 @@ class YNABClient:
             endpoint: API endpoint (e.g., "/budgets")
             data: Request body for POST/PATCH
             params: Query parameters
+            fresh: For GETs, skip the cache and any request already in flight
             
         Returns:
             JSON response from YNAB API
@@ -154,42 +310,208 @@ class YNABClient:
         Raises:
             YNABAPIError: On API errors
         """
-        client = await self._get_client()
+        if method != "GET":
+            # Invalidate both before and after, so GETs that overlap the write
+            # are neither joined nor cached
+            self._invalidate()
+            try:
+                return await self._send(method, endpoint, data, params)
+            finally:
+                self._invalidate()
         
-        try:
-            response = await client.request(
-                method=method,
-                url=endpoint,
-                json=data,
-                params=params,
-            )
-            response.raise_for_status()
-            return response.json()
-
-        except httpx.HTTPStatusError as e:
-            error_detail = ""
+        cache_key = (endpoint, tuple(sorted((params or {}).items())))
+        if self._cache_ttl > 0 and not fresh:
+            cached = self._cache.get(cache_key)
+            if cached is not None and time.monotonic() < cached[0]:
+                return cached[1]
+        
+        # Identical GETs already in flight share one upstream request
+        entry = None if fresh else self._inflight.get(cache_key)
+        if entry is None:
+            future = asyncio.ensure_future(self._send(method, endpoint, data, params))
+            entry = self._track_inflight(cache_key, future)
+        inflight, generation = entry
+        # shield() so one caller cancelling doesn't fail the others
+        result = await asyncio.shield(inflight)
+        
+        # A response that started before the last write may predate it
+        if self._cache_ttl > 0 and generation == self._write_gen:
+            self._cache[cache_key] = (time.monotonic() + self._ttl_for(endpoint), result)
+        return result
+
+    def _track_inflight(self, key: Tuple[Any, ...], future: asyncio.Future) -> Tuple[asyncio.Future, int]:
+        """Register an in-flight GET so identical requests can join it."""
+        entry = (future, self._write_gen)
+        self._inflight[key] = entry
+
+        def forget(_: asyncio.Future):
+            # The slot may already hold a newer request after a write
+            if self._inflight.get(key) is entry:
+                del self._inflight[key]
+
+        future.add_done_callback(forget)
+        return entry
+
+    def _invalidate(self):
+        """Drop cached and in-flight GETs; budget IDs may be aliased ("last-used")."""
+        self._write_gen += 1
+        self._cache.clear()
+        self._inflight.clear()
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Send a request with rate limiting and retries, and decode the JSON response."""
+        for attempt in range(MAX_RETRIES + 1):
+            await self._limiter.acquire()
             try:
-                error_data = e.response.json()
-                if "error" in error_data:
-                    error_detail = error_data["error"].get("detail", "")
-            except Exception:
-                pass
+                response = await self._client.request(
+                    method=method,
+                    url=endpoint,
+                    content=json_dumps(data) if data is not None else None,
+                    params=params,
+                )
+            except httpx.TimeoutException:
+                raise YNABAPIError("Request timed out. Please try again.")
+            except httpx.RequestError as e:
+                raise YNABAPIError(f"Network error: {str(e)}")
             
-            if e.response.status_code == 401:
-                raise YNABAPIError("Invalid or expired API token. Please update your token.")
-            elif e.response.status_code == 403:
-                raise YNABAPIError(f"Permission denied: {error_detail}")
-            elif e.response.status_code == 404:
-                raise YNABAPIError(f"Resource not found: {error_detail}")
-            elif e.response.status_code == 429:
-                raise YNABAPIError("Rate limit exceeded. Please wait before making more requests.")
-            else:
-                raise YNABAPIError(f"API error {e.response.status_code}: {error_detail}")
-                
-        except httpx.TimeoutException:
-            raise YNABAPIError("Request timed out. Please try again.")
-        except httpx.RequestError as e:
-            raise YNABAPIError(f"Network error: {str(e)}")
+            if response.is_error:
+                if attempt < MAX_RETRIES:
+                    if response.status_code == 401 and self._refresh_token():
+                        continue
+                    delay = self._retry_delay(method, response, attempt)
+                    if delay is not None:
+                        await asyncio.sleep(delay)
+                        continue
+                self._handle_error(response)
+            
+            return json_loads(response.content)
+        
+        raise AssertionError("unreachable: the last attempt always returns or raises")
+
+    async def _request_stream(
+        self,
+        endpoint: str,
+        item_prefix: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Stream a GET request, yielding array items as they are parsed.
+        
+        Lets callers stop after the items they need instead of downloading
+        and decoding the whole response. Responses are not cached.
+        
+        Args:
+            endpoint: API endpoint (e.g., "/budgets/{id}/transactions")
+            item_prefix: ijson prefix of the items to yield (e.g., "data.transactions.item")
+            params: Query parameters
+            
+        Raises:
+            YNABAPIError: On API errors
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            await self._limiter.acquire()
+            try:
+                async with self._client.stream("GET", endpoint, params=params) as response:
+                    if not response.is_error:
+                        reader = _AsyncByteReader(response)
+                        async for item in ijson.items(reader, item_prefix, use_float=True):
+                            yield item
+                        return
+                    
+                    await response.aread()
+                    if attempt >= MAX_RETRIES:
+                        delay = None
+                    elif response.status_code == 401 and self._refresh_token():
+                        delay = 0.0
+                    else:
+                        delay = self._retry_delay("GET", response, attempt)
+                    if delay is None:
+                        self._handle_error(response)
+                        
+            except httpx.TimeoutException:
+                raise YNABAPIError("Request timed out. Please try again.")
+            except httpx.RequestError as e:
+                raise YNABAPIError(f"Network error: {str(e)}")
+            
+            await asyncio.sleep(delay)
+
+    def _refresh_token(self) -> bool:
+        """
+        Re-read the stored token after a 401.
+        
+        Returns:
+            True if a different token was found and the client now uses it
+        """
+        if not self._token_from_storage:
+            return False
+        get_token.cache_clear()  # later clients pick up whatever is stored now
+        try:
+            token = read_token()
+        except ValueError:
+            return False
+        if token == self._token:
+            return False
+        
+        self._token = token
+        self._headers["Authorization"] = f"Bearer {token}"
+        self._client.headers["Authorization"] = f"Bearer {token}"
+        return True
+
+    @staticmethod
+    def _handle_error(response: httpx.Response) -> NoReturn:
+        """Raise a YNABAPIError describing an error response."""
+        error_detail = ""
+        try:
+            error_data = response.json()
+            if "error" in error_data:
+                error_detail = error_data["error"].get("detail", "")
+        except Exception:
+            pass
+        
+        status = response.status_code
+        message = _ERROR_MESSAGES.get(status)
+        if message is None:
+            raise YNABAPIError(f"API error {status}: {error_detail}", status)
+        raise YNABAPIError(message(error_detail), status)
+
+    def _ttl_for(self, endpoint: str) -> float:
+        """Cache lifetime for a GET endpoint (only used while caching is enabled)."""
+        if "/months" in endpoint or "/transactions" in endpoint:
+            return min(self._cache_ttl, CACHE_TTL_VOLATILE)
+        if endpoint.endswith("/payees"):
+            return max(self._cache_ttl, CACHE_TTL_PAYEES)
+        return self._cache_ttl
+
+    @staticmethod
+    def _retry_delay(method: str, response: httpx.Response, attempt: int) -> Optional[float]:
+        """
+        Work out how long to wait before retrying a failed request.
+        
+        Returns:
+            Delay in seconds, or None if the request should not be retried
+        """
+        status = response.status_code
+        # A 5xx on POST may have created the transaction already; only 429 is safe
+        if status != 429 and (status < 500 or method == "POST"):
+            return None
+        
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                delay = None
+            if delay is not None:
+                return delay if delay <= RETRY_MAX_DELAY else None
+        
+        delay = RETRY_BASE_DELAY * 2 ** attempt * (1 + random.random() * RETRY_JITTER)
+        return min(RETRY_MAX_DELAY, delay)
     
     # ========================================================================
     # BUDGET OPERATIONS
@@ -228,9 +550,20 @@ class YNABClient:
         response = await self._request("GET", f"/budgets/{budget_id}/categories")
         return response["data"]["category_groups"]
     
-    async def get_category(self, budget_id: str, category_id: str) -> Dict[str, Any]:
-        """Get a single category by ID."""
-        response = await self._request("GET", f"/budgets/{budget_id}/categories/{category_id}")
+    async def get_category(
+        self,
+        budget_id: str,
+        category_id: str,
+        fresh: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Get a single category by ID.
+        
+        Pass fresh=True when the result feeds a write, to bypass the cache.
+        """
+        response = await self._request(
+            "GET", f"/budgets/{budget_id}/categories/{category_id}", fresh=fresh
+        )
         return response["data"]["category"]
 
     async def update_category_budget(
@@ -258,9 +591,15 @@ class YNABClient:
         since_date: Optional[str] = None,
         account_id: Optional[str] = None,
         category_id: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Get transactions for a budget."""
-        params = {}
+        """
+        Get transactions for a budget.
+        
+        When a limit is given, the response is streamed and the connection
+        closed as soon as that many transactions have been read.
+        """
+        params: Dict[str, Any] = {}
         if since_date:
             params["since_date"] = since_date
             
@@ -271,8 +610,33 @@ class YNABClient:
         else:
             endpoint = f"/budgets/{budget_id}/transactions"
         
-        response = await self._request("GET", endpoint, params=params)
-        return response["data"]["transactions"]
+        if limit is None or ijson is None:
+            response = await self._request("GET", endpoint, params=params)
+            return response["data"]["transactions"][:limit]
+        
+        # Streamed reads aren't cached, but identical ones in flight are shared
+        key = (endpoint, tuple(sorted(params.items())), limit)
+        entry = self._inflight.get(key)
+        if entry is None:
+            future = asyncio.ensure_future(self._stream_transactions(endpoint, params, limit))
+            entry = self._track_inflight(key, future)
+        return await asyncio.shield(entry[0])
+
+    async def _stream_transactions(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Read the first `limit` transactions from a streamed response."""
+        transactions: List[Dict[str, Any]] = []
+        stream = self._request_stream(endpoint, "data.transactions.item", params=params)
+        async with aclosing(stream) as items:
+            async for transaction in items:
+                transactions.append(transaction)
+                if len(transactions) >= limit:
+                    break
+        return transactions
 
     async def create_transaction(
         self,
@@ -287,7 +651,13 @@ class YNABClient:
         cleared: str = "uncleared",
         approved: bool = False,
     ) -> Dict[str, Any]:
-        """Create a new transaction."""
+        """
+        Create a new transaction.
+        
+        Sent straight away unless another create for the same budget is in
+        flight; creates that arrive meanwhile are queued and sent together
+        through the bulk endpoint once it finishes.
+        """
         transaction = {
             "account_id": account_id,
             "date": date,
@@ -305,6 +675,32 @@ class YNABClient:
         if memo:
             transaction["memo"] = memo
         
+        if budget_id not in self._creating:
+            self._creating.add(budget_id)
+            try:
+                return await self._create_single(budget_id, transaction)
+            finally:
+                self._flush_next(budget_id)
+        
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending_creates.setdefault(budget_id, []).append((transaction, future))
+        return await future
+
+    async def create_transactions(
+        self,
+        budget_id: str,
+        transactions: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Create several transactions in one request."""
+        response = await self._request(
+            "POST",
+            f"/budgets/{budget_id}/transactions",
+            data={"transactions": transactions},
+        )
+        return response["data"]["transactions"]
+
+    async def _create_single(self, budget_id: str, transaction: Dict[str, Any]) -> Dict[str, Any]:
+        """Create one transaction through the single-transaction endpoint."""
         response = await self._request(
             "POST",
             f"/budgets/{budget_id}/transactions",
@@ -312,6 +708,102 @@ class YNABClient:
         )
         return response["data"]["transaction"]
 
+    def _flush_next(self, budget_id: str):
+        """Start sending the creates queued for a budget, or mark it idle if there are none."""
+        pending = self._pending_creates.pop(budget_id, None)
+        if not pending:
+            self._creating.discard(budget_id)
+            return
+        
+        batch, rest = pending[:CREATE_BATCH_MAX], pending[CREATE_BATCH_MAX:]
+        if rest:
+            self._pending_creates[budget_id] = rest
+        task = asyncio.ensure_future(self._flush_creates(budget_id, batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_creates(
+        self,
+        budget_id: str,
+        batch: List[Tuple[Dict[str, Any], asyncio.Future]],
+    ):
+        """Send a batch of queued creates and resolve each waiting caller."""
+        try:
+            if len(batch) == 1:
+                await self._resolve_single(budget_id, *batch[0])
+                return
+            
+            try:
+                created = await self.create_transactions(budget_id, [t for t, _ in batch])
+            except YNABAPIError as e:
+                # YNAB applies nothing on a rejected request, so resend one by one and
+                # only fail the invalid ones. After a timeout or 5xx the batch may have
+                # been created, so resending could duplicate it.
+                if e.status_code in _PER_ITEM_RETRY_STATUSES:
+                    await asyncio.gather(*(
+                        self._resolve_single(budget_id, transaction, future)
+                        for transaction, future in batch
+                    ))
+                    return
+                raise
+            
+            self._match_created(batch, created)
+        except asyncio.CancelledError:
+            self._fail_waiters(batch, YNABAPIError(
+                "Creating the transaction was interrupted; it may or may not have been created."
+            ))
+            raise
+        except Exception as e:
+            self._fail_waiters(batch, e)
+        finally:
+            self._flush_next(budget_id)
+
+    async def _resolve_single(
+        self,
+        budget_id: str,
+        transaction: Dict[str, Any],
+        future: asyncio.Future,
+    ):
+        """Create one queued transaction on its own and resolve its caller."""
+        try:
+            created = await self._create_single(budget_id, transaction)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(created)
+
+    @staticmethod
+    def _match_created(
+        batch: List[Tuple[Dict[str, Any], asyncio.Future]],
+        created: List[Dict[str, Any]],
+    ):
+        """Give each caller its own created transaction, matched on _created_key."""
+        by_key: Dict[Tuple[Any, ...], List[Dict[str, Any]]] = {}
+        for transaction in created:
+            by_key.setdefault(_created_key(transaction), []).append(transaction)
+        
+        for transaction, future in batch:
+            # Identical keys are interchangeable; take them in response order
+            matches = by_key.get(_created_key(transaction))
+            match = matches.pop(0) if matches else None
+            if future.done():
+                continue
+            if match is None:
+                future.set_exception(YNABAPIError(
+                    "YNAB did not return this transaction; check the account before retrying."
+                ))
+            else:
+                future.set_result(match)
+
+    @staticmethod
+    def _fail_waiters(batch: List[Tuple[Dict[str, Any], asyncio.Future]], error: BaseException):
+        """Fail every caller in the batch that is still waiting."""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
     async def update_transaction(
         self,
         budget_id: str,
@@ -347,4 +839,7 @@ class YNABClient:
 
 class YNABAPIError(Exception):
     """Exception raised for YNAB API errors."""
-    pass
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code  # HTTP status, if YNAB sent a response
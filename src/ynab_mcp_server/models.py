@@ -7,30 +7,46 @@ All inputs are validated before being passed to the YNAB API.
 from typing import Optional
 from enum import Enum
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
 
 
 # ============================================================================
 # COMMON MODELS
 # ============================================================================
 
-class BudgetIdInput(BaseModel):
-    """Base model with budget_id field."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+class ToolInput(BaseModel):
+    """
+    Base model for all tool inputs; validated once and then read-only.
     
+    Handlers read fields as attributes, which pydantic v2 keeps in the
+    instance __dict__, so a model_dump() copy per call would cost more than
+    it saves. Enum fields are str enums that compare equal to and serialize
+    as their values, so they need no .value calls or use_enum_values.
+    """
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
+
+
+class BudgetIdInput(ToolInput):
+    """Base model with budget_id field."""
     budget_id: str = Field(
         default="last-used",
         description="Budget ID or 'last-used' for the most recently accessed budget",
     )
 
 
+class ResponseFormat(str, Enum):
+    """Output format for list tools."""
+    MARKDOWN = "markdown"
+    JSON = "json"
+
+
 # ============================================================================
 # BUDGET TOOLS
 # ============================================================================
 
-class GetBudgetsInput(BaseModel):
+class GetBudgetsInput(ToolInput):
     """Input for listing all budgets."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    pass
 
 
 class GetBudgetInput(BudgetIdInput):
@@ -76,6 +92,13 @@ class MoveMoneyCategoryInput(BudgetIdInput):
         description="Month in YYYY-MM-DD format (first of month). Defaults to current month.",
         pattern=r"^\d{4}-\d{2}-01$",
     )
+    
+    @model_validator(mode="after")
+    def validate_categories_differ(self) -> "MoveMoneyCategoryInput":
+        """Both categories are updated concurrently, so they must be different."""
+        if self.from_category_id == self.to_category_id:
+            raise ValueError("from_category_id and to_category_id must be different")
+        return self
 
 
 class SetCategoryBudgetInput(BudgetIdInput):
@@ -104,12 +127,16 @@ class GetTransactionsInput(BudgetIdInput):
     """Input for listing transactions."""
     since_date: Optional[str] = Field(
         default=None,
-        description="Only return transactions on or after this date (YYYY-MM-DD)",
+        description="Only return transactions on or after this date (YYYY-MM-DD). Defaults to 90 days ago.",
         pattern=r"^\d{4}-\d{2}-\d{2}$",
     )
     account_id: Optional[str] = Field(default=None, description="Filter by account ID")
     category_id: Optional[str] = Field(default=None, description="Filter by category ID")
     limit: int = Field(default=50, description="Maximum number of transactions to return", ge=1, le=500)
+    format: ResponseFormat = Field(
+        default=ResponseFormat.MARKDOWN,
+        description="'markdown' for a readable table, 'json' for the raw YNAB transaction objects",
+    )
 
 
 class CreateTransactionInput(BudgetIdInput):
@@ -154,6 +181,14 @@ class GetMonthSummaryInput(BudgetIdInput):
     month: Optional[str] = Field(default="current", description="Month in YYYY-MM-DD format or 'current'")
 
 
+class GetSnapshotInput(BudgetIdInput):
+    """Input for getting accounts, categories, and the current month in one call."""
+    pass
+
+
 class GetPayeesInput(BudgetIdInput):
     """Input for listing all payees."""
-    pass
+    format: ResponseFormat = Field(
+        default=ResponseFormat.MARKDOWN,
+        description="'markdown' for a readable list, 'json' for the raw YNAB payee objects",
+    )
@@ -9,13 +9,19 @@ Or via the CLI: ynab-mcp
 
 import sys
 import asyncio
-from datetime import date
-from typing import Optional
+import argparse
+import heapq
+import functools
+from operator import itemgetter
+from collections import ChainMap, defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Iterator, Optional
 from contextlib import asynccontextmanager
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import FastMCP, Context
 
-from .api import YNABClient, YNABAPIError, store_token, get_token
+from .api import YNABClient, YNABAPIError, store_token, read_token, json_dumps
 from .models import (
     GetBudgetsInput,
     GetBudgetInput,
@@ -29,7 +35,9 @@ from .models import (
     CreateTransactionInput,
     UpdateTransactionInput,
     GetMonthSummaryInput,
+    GetSnapshotInput,
     GetPayeesInput,
+    ResponseFormat,
 )
 
 
@@ -37,9 +45,38 @@ from .models import (
 # HELPER FUNCTIONS
 # ============================================================================
 
+# YNAB's internal category groups, never shown to the user
+_HIDDEN_GROUPS = frozenset({"Internal Master Category", "Credit Card Payments"})
+
+# How far back ynab_get_transactions looks when no since_date is given
+DEFAULT_TRANSACTION_DAYS = 90
+
+# Maximum number of payees listed by ynab_get_payees
+MAX_PAYEES_SHOWN = 100
+
+# Name prefixes of the payees YNAB creates for transfers between accounts
+_TRANSFER_PREFIXES = ("Transfer : ", "Transfer:")
+
+# Transaction status marks, indexed by (cleared << 1) | approved
+_STATUS_MARKS = ("○", "○✓", "✓", "✓✓")
+
+# Fields read per transaction row, with values for any YNAB leaves out
+# (payee_name and category_name are optional and may also be null)
+_row_fields = itemgetter("date", "payee_name", "category_name", "amount", "cleared", "approved")
+_ROW_DEFAULTS = {
+    "date": None,
+    "payee_name": None,
+    "category_name": None,
+    "amount": 0,
+    "cleared": "uncleared",
+    "approved": False,
+}
+
+
 def dollars_to_milliunits(dollars: float) -> int:
     """Convert dollars to YNAB milliunits (1000 milliunits = $1.00)."""
-    return int(round(dollars * 1000))
+    # str() gives the shortest repr, so 45.67 becomes exactly 45670, not 45670.000000000001
+    return int((Decimal(str(dollars)) * 1000).to_integral_value())
 
 
 def milliunits_to_dollars(milliunits: int) -> float:
@@ -47,10 +84,23 @@ def milliunits_to_dollars(milliunits: int) -> float:
     return milliunits / 1000
 
 
+@functools.lru_cache(maxsize=4096)
 def format_currency(milliunits: int) -> str:
-    """Format milliunits as currency string."""
-    dollars = milliunits_to_dollars(milliunits)
-    return f"${dollars:,.2f}"
+    """Format milliunits as currency string (integer math, rounds half-cents away from zero)."""
+    sign = "-" if milliunits < 0 else ""
+    whole, frac = divmod(abs(milliunits), 1000)
+    cents = (frac + 5) // 10
+    if cents == 100:
+        whole += 1
+        cents = 0
+    return f"${sign}{whole:,}.{cents:02d}"
+
+
+def to_json(data) -> str:
+    """Serialize API data for format="json" responses."""
+    encoded = json_dumps(data)
+    # orjson returns bytes, the stdlib fallback returns str
+    return encoded.decode() if isinstance(encoded, bytes) else encoded
 
 
 def get_current_month() -> str:
@@ -59,23 +109,165 @@ def get_current_month() -> str:
     return f"{today.year}-{today.month:02d}-01"
 
 
-def format_error(e: Exception) -> str:
+def get_client(ctx: Context) -> YNABClient:
+    """Get the shared YNAB client created by the server lifespan."""
+    return ctx.request_context.lifespan_context["client"]
+
+
+def format_error(e: BaseException) -> str:
     """Format error for consistent error responses."""
+    # Report the first underlying failure from a TaskGroup
+    while isinstance(e, ExceptionGroup):
+        e = e.exceptions[0]
     if isinstance(e, YNABAPIError):
         return f"Error: {str(e)}"
     return f"Error: Unexpected error - {type(e).__name__}: {str(e)}"
 
 
+async def undo_budget_change(
+    client: YNABClient,
+    budget_id: str,
+    month: str,
+    category: dict,
+    category_id: str,
+    before: int,
+    after: int,
+    error: BaseException,
+) -> str:
+    """
+    Restore one side of a half-applied move, then re-raise the failure of the other.
+    
+    Returns a warning instead if the restore also fails, since the budget is then
+    left off by the moved amount.
+    """
+    try:
+        await client.update_category_budget(budget_id, category_id, month, before)
+    except Exception as rollback_error:
+        return (
+            f"{format_error(error)}\n\n"
+            f"⚠️ The change to {category['name']} was applied but could not be undone "
+            f"({format_error(rollback_error)}). It is now budgeted at "
+            f"{format_currency(after)} instead of {format_currency(before)}; "
+            f"please correct it in YNAB."
+        )
+    raise error
+
+
+def format_accounts(accounts: list) -> str:
+    """Render open accounts grouped by type, with a total balance."""
+    active = [a for a in accounts if not (a.get("deleted") or a.get("closed"))]
+    total_balance = sum(a.get("balance", 0) for a in active)
+
+    by_type: dict[str, list] = defaultdict(list)
+    for a in active:
+        by_type[a.get("type", "other")].append(a)
+
+    parts = ["## Accounts\n\n"]
+
+    for atype, accts in by_type.items():
+        parts.append(f"### {atype.replace('_', ' ').title()}\n\n")
+        for a in accts:
+            parts.append(f"- **{a['name']}**: {format_currency(a.get('balance', 0))}\n")
+            parts.append(f"  - ID: `{a['id']}`\n")
+        parts.append("\n")
+
+    parts.append(f"**Total Balance: {format_currency(total_balance)}**\n")
+    return "".join(parts)
+
+
+def format_categories(category_groups: list) -> str:
+    """Render visible category groups as budgeted/spent/available tables."""
+    parts = ["## Budget Categories\n\n"]
+
+    for group in category_groups:
+        if group.get("hidden") or group.get("deleted") or group["name"] in _HIDDEN_GROUPS:
+            continue
+
+        parts.append(f"### {group['name']}\n\n")
+        parts.append("| Category | Budgeted | Spent | Available |\n")
+        parts.append("|----------|----------|-------|----------|\n")
+
+        visible = (
+            c for c in group.get("categories", [])
+            if not (c.get("hidden") or c.get("deleted"))
+        )
+        for cat in visible:
+            budgeted = format_currency(cat.get("budgeted", 0))
+            activity = format_currency(cat.get("activity", 0))
+            balance = format_currency(cat.get("balance", 0))
+
+            parts.append(f"| {cat['name']} | {budgeted} | {activity} | {balance} |\n")
+            parts.append(f"| ↳ ID: `{cat['id']}` | | | |\n")
+
+        parts.append("\n")
+    
+    return "".join(parts)
+
+
+def format_month_summary(month_data: dict, month: str) -> str:
+    """Render a budget month's totals and any overspent categories."""
+    parts = [f"## Budget Summary for {month_data.get('month', month)}\n\n"]
+
+    income = month_data.get("income", 0)
+    budgeted = month_data.get("budgeted", 0)
+    activity = month_data.get("activity", 0)
+    to_be_budgeted = month_data.get("to_be_budgeted", 0)
+
+    parts.append(f"- **Income**: {format_currency(income)}\n")
+    parts.append(f"- **Budgeted**: {format_currency(budgeted)}\n")
+    parts.append(f"- **Spending (Activity)**: {format_currency(activity)}\n")
+    parts.append(f"- **To Be Budgeted**: {format_currency(to_be_budgeted)}\n\n")
+
+    # Overspending is the exception, so only write the header on the first hit
+    header_written = False
+    for c in month_data.get("categories", []):
+        balance = c.get("balance", 0)
+        if balance < 0:
+            if not header_written:
+                parts.append("### ⚠️ Overspent Categories\n\n")
+                header_written = True
+            parts.append(f"- **{c['name']}**: {format_currency(balance)}\n")
+    if header_written:
+        parts.append("\n")
+    
+    return "".join(parts)
+
+
+def transaction_rows(transactions: list) -> Iterator[str]:
+    """Yield the Markdown transaction table line by line, ending with the total."""
+    yield "## Transactions\n\n"
+    yield "| Date | Payee | Category | Amount | Status |\n"
+    yield "|------|-------|----------|--------|--------|\n"
+    
+    fmt = format_currency
+    total = 0
+    for t in transactions:
+        # Defaults are read through, leaving the (possibly cached) payload untouched
+        fields = ChainMap(t, _ROW_DEFAULTS)
+        txn_date, payee, category, amount, cleared, approved = _row_fields(fields)
+        total += amount
+        status = _STATUS_MARKS[((cleared == "cleared") << 1) | approved]
+        
+        yield (
+            f"| {txn_date or 'N/A'} | {(payee or 'Unknown')[:30]} "
+            f"| {(category or 'Uncategorized')[:25]} | {fmt(amount)} | {status} |\n"
+        )
+    
+    yield f"\n**Total: {format_currency(total)}** ({len(transactions)} transactions)\n"
+
+
 # ============================================================================
 # MCP SERVER SETUP
 # ============================================================================
 
 @asynccontextmanager
 async def lifespan(server):
-    """Manage YNAB client lifecycle."""
+    """Manage YNAB client lifecycle. One client is shared by every tool call."""
     client = YNABClient()
-    yield {"client": client}
-    await client.close()
+    try:
+        yield {"client": client}
+    finally:
+        await client.close()
 
 
 mcp = FastMCP("ynab_mcp", lifespan=lifespan)
@@ -95,19 +287,19 @@ mcp = FastMCP("ynab_mcp", lifespan=lifespan)
         "openWorldHint": False,
     }
 )
-async def ynab_get_budgets(params: GetBudgetsInput) -> str:
+async def ynab_get_budgets(params: GetBudgetsInput, ctx: Context) -> str:
     """List all budgets available to the authenticated user."""
     try:
-        async with YNABClient() as client:
-            budgets = await client.get_budgets()
+        client = get_client(ctx)
+        budgets = await client.get_budgets()
         
-        result = "## Your YNAB Budgets\n\n"
+        parts = ["## Your YNAB Budgets\n\n"]
         for b in budgets:
-            result += f"- **{b['name']}**\n"
-            result += f"  - ID: `{b['id']}`\n"
-            result += f"  - Last modified: {b.get('last_modified_on', 'N/A')}\n\n"
+            parts.append(f"- **{b['name']}**\n")
+            parts.append(f"  - ID: `{b['id']}`\n")
+            parts.append(f"  - Last modified: {b.get('last_modified_on', 'N/A')}\n\n")
         
-        return result
+        return "".join(parts)
     except Exception as e:
         return format_error(e)
 
@@ -122,35 +314,13 @@ async def ynab_get_budgets(params: GetBudgetsInput) -> str:
         "openWorldHint": False,
     }
 )
-async def ynab_get_accounts(params: GetAccountsInput) -> str:
+async def ynab_get_accounts(params: GetAccountsInput, ctx: Context) -> str:
     """List all accounts in a budget with their current balances."""
     try:
-        async with YNABClient() as client:
-            accounts = await client.get_accounts(params.budget_id)
-        
-        by_type = {}
-        for a in accounts:
-            if a.get("deleted") or a.get("closed"):
-                continue
-            atype = a.get("type", "other")
-            if atype not in by_type:
-                by_type[atype] = []
-            by_type[atype].append(a)
+        client = get_client(ctx)
+        accounts = await client.get_accounts(params.budget_id)
         
-        result = "## Accounts\n\n"
-        total_balance = 0
-        
-        for atype, accts in by_type.items():
-            result += f"### {atype.replace('_', ' ').title()}\n\n"
-            for a in accts:
-                balance = a.get("balance", 0)
-                total_balance += balance
-                result += f"- **{a['name']}**: {format_currency(balance)}\n"
-                result += f"  - ID: `{a['id']}`\n"
-            result += "\n"
-        
-        result += f"**Total Balance: {format_currency(total_balance)}**\n"
-        return result
+        return format_accounts(accounts)
     except Exception as e:
         return format_error(e)
 
@@ -169,38 +339,13 @@ async def ynab_get_accounts(params: GetAccountsInput) -> str:
         "openWorldHint": False,
     }
 )
-async def ynab_get_categories(params: GetCategoriesInput) -> str:
+async def ynab_get_categories(params: GetCategoriesInput, ctx: Context) -> str:
     """List all category groups and categories with budgeted amounts and balances."""
     try:
-        async with YNABClient() as client:
-            category_groups = await client.get_categories(params.budget_id)
-        
-        result = "## Budget Categories\n\n"
-        
-        for group in category_groups:
-            if group.get("hidden") or group.get("deleted"):
-                continue
-            if group["name"] in ["Internal Master Category", "Credit Card Payments"]:
-                continue
-                
-            result += f"### {group['name']}\n\n"
-            result += "| Category | Budgeted | Spent | Available |\n"
-            result += "|----------|----------|-------|----------|\n"
-            
-            for cat in group.get("categories", []):
-                if cat.get("hidden") or cat.get("deleted"):
-                    continue
-                    
-                budgeted = format_currency(cat.get("budgeted", 0))
-                activity = format_currency(cat.get("activity", 0))
-                balance = format_currency(cat.get("balance", 0))
-                
-                result += f"| {cat['name']} | {budgeted} | {activity} | {balance} |\n"
-                result += f"| ↳ ID: `{cat['id']}` | | | |\n"
-            
-            result += "\n"
+        client = get_client(ctx)
+        category_groups = await client.get_categories(params.budget_id)
         
-        return result
+        return format_categories(category_groups)
     except Exception as e:
         return format_error(e)
 
@@ -215,43 +360,69 @@ async def ynab_get_categories(params: GetCategoriesInput) -> str:
         "openWorldHint": False,
     }
 )
-async def ynab_move_money(params: MoveMoneyCategoryInput) -> str:
+async def ynab_move_money(params: MoveMoneyCategoryInput, ctx: Context) -> str:
     """Move money from one category to another."""
     try:
         month = params.month or get_current_month()
         amount_milliunits = dollars_to_milliunits(params.amount)
         
-        async with YNABClient() as client:
-            from_cat = await client.get_category(params.budget_id, params.from_category_id)
-            to_cat = await client.get_category(params.budget_id, params.to_category_id)
-            
-            from_budgeted = from_cat.get("budgeted", 0)
-            to_budgeted = to_cat.get("budgeted", 0)
-            
-            if from_budgeted < amount_milliunits:
-                return (
-                    f"Error: {from_cat['name']} only has {format_currency(from_budgeted)} budgeted. "
-                    f"Cannot move {format_currency(amount_milliunits)}."
-                )
-            
-            new_from = from_budgeted - amount_milliunits
-            new_to = to_budgeted + amount_milliunits
-
-            await client.update_category_budget(
-                params.budget_id, params.from_category_id, month, new_from
+        client = get_client(ctx)
+        # The new amounts are computed from these, so read them uncached
+        async with asyncio.TaskGroup() as tg:
+            from_task = tg.create_task(
+                client.get_category(params.budget_id, params.from_category_id, fresh=True)
             )
-            await client.update_category_budget(
-                params.budget_id, params.to_category_id, month, new_to
+            to_task = tg.create_task(
+                client.get_category(params.budget_id, params.to_category_id, fresh=True)
+            )
+        from_cat, to_cat = from_task.result(), to_task.result()
+        
+        from_budgeted = from_cat.get("budgeted", 0)
+        to_budgeted = to_cat.get("budgeted", 0)
+        
+        if from_budgeted < amount_milliunits:
+            return (
+                f"Error: {from_cat['name']} only has {format_currency(from_budgeted)} budgeted. "
+                f"Cannot move {format_currency(amount_milliunits)}."
             )
         
-        result = f"## Money Moved Successfully\n\n"
-        result += f"**Moved {format_currency(amount_milliunits)}** from {from_cat['name']} to {to_cat['name']}\n\n"
-        result += f"| Category | Before | After |\n"
-        result += f"|----------|--------|-------|\n"
-        result += f"| {from_cat['name']} | {format_currency(from_budgeted)} | {format_currency(new_from)} |\n"
-        result += f"| {to_cat['name']} | {format_currency(to_budgeted)} | {format_currency(new_to)} |\n"
+        new_from = from_budgeted - amount_milliunits
+        new_to = to_budgeted + amount_milliunits
+
+        from_result: dict | BaseException
+        to_result: dict | BaseException
+        from_result, to_result = await asyncio.gather(
+            client.update_category_budget(
+                params.budget_id, params.from_category_id, month, new_from
+            ),
+            client.update_category_budget(
+                params.budget_id, params.to_category_id, month, new_to
+            ),
+            return_exceptions=True,
+        )
+
+        # If only one side was applied, put it back so money isn't lost or created
+        if isinstance(from_result, BaseException):
+            if isinstance(to_result, BaseException):
+                raise from_result
+            return await undo_budget_change(
+                client, params.budget_id, month, to_cat, params.to_category_id,
+                to_budgeted, new_to, from_result,
+            )
+        if isinstance(to_result, BaseException):
+            return await undo_budget_change(
+                client, params.budget_id, month, from_cat, params.from_category_id,
+                from_budgeted, new_from, to_result,
+            )
+
+        parts = ["## Money Moved Successfully\n\n"]
+        parts.append(f"**Moved {format_currency(amount_milliunits)}** from {from_cat['name']} to {to_cat['name']}\n\n")
+        parts.append("| Category | Before | After |\n")
+        parts.append("|----------|--------|-------|\n")
+        parts.append(f"| {from_cat['name']} | {format_currency(from_budgeted)} | {format_currency(new_from)} |\n")
+        parts.append(f"| {to_cat['name']} | {format_currency(to_budgeted)} | {format_currency(new_to)} |\n")
         
-        return result
+        return "".join(parts)
     except Exception as e:
         return format_error(e)
 
@@ -270,42 +441,31 @@ async def ynab_move_money(params: MoveMoneyCategoryInput) -> str:
         "openWorldHint": False,
     }
 )
-async def ynab_get_transactions(params: GetTransactionsInput) -> str:
+async def ynab_get_transactions(params: GetTransactionsInput, ctx: Context) -> str:
     """List recent transactions, optionally filtered by date, account, or category."""
     try:
-        async with YNABClient() as client:
-            transactions = await client.get_transactions(
-                params.budget_id,
-                since_date=params.since_date,
-                account_id=params.account_id,
-                category_id=params.category_id,
-            )
-        
-        transactions = transactions[:params.limit]
+        client = get_client(ctx)
+        since_date = params.since_date or (
+            date.today() - timedelta(days=DEFAULT_TRANSACTION_DAYS)
+        ).isoformat()
+        
+        transactions = await client.get_transactions(
+            params.budget_id,
+            since_date=since_date,
+            account_id=params.account_id,
+            category_id=params.category_id,
+            limit=params.limit,
+        )
+        
+        if params.format == ResponseFormat.JSON:
+            return to_json(transactions)
         
         if not transactions:
             return "No transactions found matching the criteria."
         
-        result = "## Transactions\n\n"
-        result += "| Date | Payee | Category | Amount | Status |\n"
-        result += "|------|-------|----------|--------|--------|\n"
-        
-        total = 0
-        for t in transactions:
-            date_str = t.get("date", "N/A")
-            payee = t.get("payee_name", "Unknown")[:30]
-            category = t.get("category_name", "Uncategorized")[:25]
-            amount = t.get("amount", 0)
-            total += amount
-            
-            status = "✓" if t.get("cleared") == "cleared" else "○"
-            if t.get("approved"):
-                status += "✓"
-            
-            result += f"| {date_str} | {payee} | {category} | {format_currency(amount)} | {status} |\n"
-        
-        result += f"\n**Total: {format_currency(total)}** ({len(transactions)} transactions)\n"
-        return result
+        # FastMCP only passes str results through as text content (bytes would be
+        # re-serialized as JSON), so a single join is the cheapest way to build it
+        return "".join(transaction_rows(transactions))
     except Exception as e:
         return format_error(e)
 
@@ -320,34 +480,32 @@ async def ynab_get_transactions(params: GetTransactionsInput) -> str:
         "openWorldHint": False,
     }
 )
-async def ynab_create_transaction(params: CreateTransactionInput) -> str:
+async def ynab_create_transaction(params: CreateTransactionInput, ctx: Context) -> str:
     """Create a new transaction. Use negative amounts for spending, positive for income."""
     try:
-        amount_milliunits = dollars_to_milliunits(params.amount)
-        
-        async with YNABClient() as client:
-            transaction = await client.create_transaction(
-                budget_id=params.budget_id,
-                account_id=params.account_id,
-                amount=amount_milliunits,
-                date=params.date,
-                payee_name=params.payee_name,
-                category_id=params.category_id,
-                memo=params.memo,
-                cleared=params.cleared.value,
-                approved=params.approved,
-            )
-        
-        result = "## Transaction Created\n\n"
-        result += f"- **ID**: `{transaction['id']}`\n"
-        result += f"- **Date**: {transaction['date']}\n"
-        result += f"- **Amount**: {format_currency(transaction['amount'])}\n"
-        result += f"- **Payee**: {transaction.get('payee_name', 'N/A')}\n"
-        result += f"- **Category**: {transaction.get('category_name', 'Uncategorized')}\n"
+        client = get_client(ctx)
+        transaction = await client.create_transaction(
+            budget_id=params.budget_id,
+            account_id=params.account_id,
+            amount=dollars_to_milliunits(params.amount),
+            date=params.date,
+            payee_name=params.payee_name,
+            category_id=params.category_id,
+            memo=params.memo,
+            cleared=params.cleared,  # str enum, serialized as its value
+            approved=params.approved,
+        )
+        
+        parts = ["## Transaction Created\n\n"]
+        parts.append(f"- **ID**: `{transaction['id']}`\n")
+        parts.append(f"- **Date**: {transaction['date']}\n")
+        parts.append(f"- **Amount**: {format_currency(transaction['amount'])}\n")
+        parts.append(f"- **Payee**: {transaction.get('payee_name', 'N/A')}\n")
+        parts.append(f"- **Category**: {transaction.get('category_name', 'Uncategorized')}\n")
         if params.memo:
-            result += f"- **Memo**: {params.memo}\n"
+            parts.append(f"- **Memo**: {params.memo}\n")
         
-        return result
+        return "".join(parts)
     except Exception as e:
         return format_error(e)
 
@@ -362,10 +520,10 @@ async def ynab_create_transaction(params: CreateTransactionInput) -> str:
         "openWorldHint": False,
     }
 )
-async def ynab_update_transaction(params: UpdateTransactionInput) -> str:
+async def ynab_update_transaction(params: UpdateTransactionInput, ctx: Context) -> str:
     """Update an existing transaction. Only specified fields will be updated."""
     try:
-        updates = {}
+        updates: dict[str, Any] = {}
         
         if params.amount is not None:
             updates["amount"] = dollars_to_milliunits(params.amount)
@@ -378,27 +536,27 @@ async def ynab_update_transaction(params: UpdateTransactionInput) -> str:
         if params.memo is not None:
             updates["memo"] = params.memo
         if params.cleared is not None:
-            updates["cleared"] = params.cleared.value
+            updates["cleared"] = params.cleared
         if params.approved is not None:
             updates["approved"] = params.approved
         
         if not updates:
             return "Error: No fields to update. Specify at least one field to change."
         
-        async with YNABClient() as client:
-            transaction = await client.update_transaction(
-                params.budget_id,
-                params.transaction_id,
-                **updates,
-            )
+        client = get_client(ctx)
+        transaction = await client.update_transaction(
+            params.budget_id,
+            params.transaction_id,
+            **updates,
+        )
         
-        result = "## Transaction Updated\n\n"
-        result += f"- **ID**: `{transaction['id']}`\n"
-        result += f"- **Date**: {transaction['date']}\n"
-        result += f"- **Amount**: {format_currency(transaction['amount'])}\n"
-        result += f"- **Payee**: {transaction.get('payee_name', 'N/A')}\n"
+        parts = ["## Transaction Updated\n\n"]
+        parts.append(f"- **ID**: `{transaction['id']}`\n")
+        parts.append(f"- **Date**: {transaction['date']}\n")
+        parts.append(f"- **Amount**: {format_currency(transaction['amount'])}\n")
+        parts.append(f"- **Payee**: {transaction.get('payee_name', 'N/A')}\n")
         
-        return result
+        return "".join(parts)
     except Exception as e:
         return format_error(e)
 
@@ -417,36 +575,48 @@ async def ynab_update_transaction(params: UpdateTransactionInput) -> str:
         "openWorldHint": False,
     }
 )
-async def ynab_get_month_summary(params: GetMonthSummaryInput) -> str:
-    """Get a summary of a budget month including income, budgeted amounts, and spending."""
+async def ynab_get_month_summary(params: GetMonthSummaryInput, ctx: Context) -> str:
+    """
+    Get a summary of a budget month including income, budgeted amounts, and spending.
+    
+    To see accounts and categories alongside the current month, call ynab_get_snapshot
+    instead; it fetches all three in parallel.
+    """
     try:
         month = params.month or "current"
         
-        async with YNABClient() as client:
-            month_data = await client.get_budget_month(params.budget_id, month)
-        
-        result = f"## Budget Summary for {month_data.get('month', month)}\n\n"
-        
-        income = month_data.get("income", 0)
-        budgeted = month_data.get("budgeted", 0)
-        activity = month_data.get("activity", 0)
-        to_be_budgeted = month_data.get("to_be_budgeted", 0)
-        
-        result += f"- **Income**: {format_currency(income)}\n"
-        result += f"- **Budgeted**: {format_currency(budgeted)}\n"
-        result += f"- **Spending (Activity)**: {format_currency(activity)}\n"
-        result += f"- **To Be Budgeted**: {format_currency(to_be_budgeted)}\n\n"
-        
-        categories = month_data.get("categories", [])
-        
-        overspent = [c for c in categories if c.get("balance", 0) < 0]
-        if overspent:
-            result += "### ⚠️ Overspent Categories\n\n"
-            for c in overspent:
-                result += f"- **{c['name']}**: {format_currency(c['balance'])}\n"
-            result += "\n"
+        client = get_client(ctx)
+        month_data = await client.get_budget_month(params.budget_id, month)
         
-        return result
+        return format_month_summary(month_data, month)
+    except Exception as e:
+        return format_error(e)
+
+
+@mcp.tool(
+    name="ynab_get_snapshot",
+    annotations={
+        "title": "Get Budget Snapshot",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False,
+    }
+)
+async def ynab_get_snapshot(params: GetSnapshotInput, ctx: Context) -> str:
+    """Get accounts, categories, and the current month summary in a single call."""
+    try:
+        client = get_client(ctx)
+        async with asyncio.TaskGroup() as tg:
+            accounts = tg.create_task(client.get_accounts(params.budget_id))
+            category_groups = tg.create_task(client.get_categories(params.budget_id))
+            month_data = tg.create_task(client.get_budget_month(params.budget_id, "current"))
+        
+        return "\n".join([
+            format_month_summary(month_data.result(), "current"),
+            format_accounts(accounts.result()),
+            format_categories(category_groups.result()),
+        ])
     except Exception as e:
         return format_error(e)
 
@@ -461,24 +631,33 @@ async def ynab_get_month_summary(params: GetMonthSummaryInput) -> str:
         "openWorldHint": False,
     }
 )
-async def ynab_get_payees(params: GetPayeesInput) -> str:
+async def ynab_get_payees(params: GetPayeesInput, ctx: Context) -> str:
     """List all payees in the budget."""
     try:
-        async with YNABClient() as client:
-            payees = await client.get_payees(params.budget_id)
+        client = get_client(ctx)
+        payees = await client.get_payees(params.budget_id)
         
-        payees = [p for p in payees if not p.get("deleted") and not p["name"].startswith("Transfer")]
-        payees = sorted(payees, key=lambda p: p["name"].lower())
+        # Casefold each name once; the index breaks ties so payee dicts are never compared
+        decorated = [
+            (p["name"].casefold(), i, p)
+            for i, p in enumerate(payees)
+            if not p.get("deleted") and not p["name"].startswith(_TRANSFER_PREFIXES)
+        ]
+        if params.format == ResponseFormat.JSON:
+            return to_json([p for _, _, p in decorated])
         
-        result = f"## Payees ({len(payees)} total)\n\n"
+        # Only the first page is shown, so select it without sorting everything
+        shown = heapq.nsmallest(MAX_PAYEES_SHOWN, decorated)
         
-        for p in payees[:100]:
-            result += f"- {p['name']} (`{p['id']}`)\n"
+        parts = [f"## Payees ({len(decorated)} total)\n\n"]
         
-        if len(payees) > 100:
-            result += f"\n*...and {len(payees) - 100} more*\n"
+        for _, _, p in shown:
+            parts.append(f"- {p['name']} (`{p['id']}`)\n")
         
-        return result
+        if len(decorated) > MAX_PAYEES_SHOWN:
+            parts.append(f"\n*...and {len(decorated) - MAX_PAYEES_SHOWN} more*\n")
+        
+        return "".join(parts)
     except Exception as e:
         return format_error(e)
 
@@ -489,8 +668,6 @@ async def ynab_get_payees(params: GetPayeesInput) -> str:
 
 def main():
     """Main entry point for the MCP server."""
-    import argparse
-    
     parser = argparse.ArgumentParser(description="YNAB MCP Server")
     parser.add_argument(
         "command",
@@ -517,14 +694,20 @@ def main():
     
     if args.command == "check-token":
         try:
-            token = get_token()
+            token = read_token()
             print(f"✓ Token found ({len(token)} characters)")
             print(f"  First 8 chars: {token[:8]}...")
         except ValueError as e:
             print(f"✗ {e}")
         return
     
-    # Default: run the MCP server
+    # Default: run the MCP server, on uvloop where it is available
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass  # uvloop not installed (e.g., Windows); use the default loop
+    
     mcp.run()
 
 
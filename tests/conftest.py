@@ -0,0 +1,70 @@
+"""
+Shared fixtures for the YNAB MCP server tests.
+
+No test talks to api.ynab.com: clients are wired to an httpx MockTransport
+that records every request and answers it from a handler function.
+"""
+
+import inspect
+import types
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from ynab_mcp_server import api
+from ynab_mcp_server.api import YNABClient
+
+
+class FakeYNAB:
+    """Records requests and answers them from a handler (sync or async)."""
+
+    def __init__(self, handler: Callable[[httpx.Request], Any]):
+        self.handler = handler
+        self.requests: list[httpx.Request] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        response = self.handler(request)
+        if inspect.isawaitable(response):
+            response = await response
+        return response
+
+    def count(self, method: str, path: str) -> int:
+        """Number of requests made with this method to this API path (without /v1)."""
+        return sum(
+            1 for r in self.requests
+            if r.method == method and r.url.path == f"/v1{path}"
+        )
+
+
+@pytest.fixture
+async def make_client():
+    """Factory for YNABClients backed by a FakeYNAB; closes them after the test."""
+    clients: list[YNABClient] = []
+
+    def factory(handler, cache_ttl: float = api.CACHE_TTL, token: str | None = "test-token"):
+        fake = FakeYNAB(handler)
+        client = YNABClient(token=token, cache_ttl=cache_ttl)
+        client._client = httpx.AsyncClient(
+            base_url=api.YNAB_API_BASE,
+            headers=client._headers,
+            transport=httpx.MockTransport(fake),
+        )
+        clients.append(client)
+        return client, fake
+
+    yield factory
+    for client in clients:
+        await client.close()
+
+
+@pytest.fixture
+def make_ctx():
+    """Factory for the MCP Context a tool sees, holding the given client."""
+    def factory(client: YNABClient):
+        return types.SimpleNamespace(
+            request_context=types.SimpleNamespace(lifespan_context={"client": client})
+        )
+    return factory
@@ -0,0 +1,353 @@
+"""Tests for YNABClient request handling."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from ynab_mcp_server import api
+from ynab_mcp_server.api import YNABAPIError
+
+
+def ok(status: int = 200, **data) -> httpx.Response:
+    """A successful YNAB response wrapping `data`."""
+    return httpx.Response(status, json={"data": data})
+
+
+def error(status: int, detail: str = "") -> httpx.Response:
+    """A YNAB error response."""
+    return httpx.Response(status, json={"error": {"detail": detail}})
+
+
+CATEGORY_PATH = "/budgets/b1/categories/c1"
+
+
+@pytest.fixture(autouse=True)
+def no_retry_wait(monkeypatch):
+    """Retry immediately instead of backing off for seconds."""
+    monkeypatch.setattr(api, "RETRY_BASE_DELAY", 0.0)
+
+
+# ============================================================================
+# GET CACHE
+# ============================================================================
+
+async def test_repeated_get_is_served_from_cache(make_client):
+    client, fake = make_client(lambda r: ok(category={"id": "c1", "budgeted": 100}))
+
+    await client.get_category("b1", "c1")
+    await client.get_category("b1", "c1")
+
+    assert fake.count("GET", CATEGORY_PATH) == 1
+
+
+async def test_cache_ttl_zero_disables_caching(make_client):
+    client, fake = make_client(lambda r: ok(category={"id": "c1"}), cache_ttl=0)
+
+    await client.get_category("b1", "c1")
+    await client.get_category("b1", "c1")
+
+    assert fake.count("GET", CATEGORY_PATH) == 2
+
+
+async def test_fresh_read_bypasses_cache(make_client):
+    client, fake = make_client(lambda r: ok(category={"id": "c1"}))
+
+    await client.get_category("b1", "c1")
+    await client.get_category("b1", "c1", fresh=True)
+
+    assert fake.count("GET", CATEGORY_PATH) == 2
+
+
+async def test_write_clears_cache(make_client):
+    state = {"budgeted": 100}
+
+    def handler(request):
+        if request.method == "PATCH":
+            state["budgeted"] = json.loads(request.content)["category"]["budgeted"]
+        return ok(category={"id": "c1", **state})
+
+    client, fake = make_client(handler)
+
+    await client.get_category("b1", "c1")
+    await client.update_category_budget("b1", "c1", "2026-01-01", 999)
+
+    assert (await client.get_category("b1", "c1"))["budgeted"] == 999
+    assert fake.count("GET", CATEGORY_PATH) == 2
+
+
+async def test_get_overlapping_a_write_is_not_cached(make_client):
+    state = {"budgeted": 100}
+    release = asyncio.Event()
+
+    async def handler(request):
+        if request.method == "PATCH":
+            state["budgeted"] = json.loads(request.content)["category"]["budgeted"]
+            return ok(category={"id": "c1", **state})
+        snapshot = dict(state)
+        await release.wait()
+        return ok(category={"id": "c1", **snapshot})
+
+    client, _ = make_client(handler)
+
+    stale = asyncio.create_task(client.get_category("b1", "c1"))
+    await asyncio.sleep(0.01)
+    await client.update_category_budget("b1", "c1", "2026-01-01", 999)
+    # Started after the write, so it must not join the stale request
+    later = asyncio.create_task(client.get_category("b1", "c1"))
+    await asyncio.sleep(0.01)
+    release.set()
+
+    assert (await stale)["budgeted"] == 100
+    assert (await later)["budgeted"] == 999
+    assert (await client.get_category("b1", "c1"))["budgeted"] == 999
+
+
+# ============================================================================
+# REQUEST COALESCING
+# ============================================================================
+
+async def test_concurrent_identical_gets_share_one_request(make_client):
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return ok(category={"id": "c1"})
+
+    client, fake = make_client(handler)
+
+    results = await asyncio.gather(*(client.get_category("b1", "c1") for _ in range(3)))
+
+    assert [r["id"] for r in results] == ["c1"] * 3
+    assert fake.count("GET", CATEGORY_PATH) == 1
+
+
+async def test_concurrent_streamed_transaction_reads_share_one_request(make_client):
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return ok(transactions=[{"id": f"t{i}", "amount": -i} for i in range(10)])
+
+    client, fake = make_client(handler)
+
+    results = await asyncio.gather(*(
+        client.get_transactions("b1", since_date="2026-01-01", limit=5) for _ in range(3)
+    ))
+
+    assert [len(r) for r in results] == [5, 5, 5]
+    assert fake.count("GET", "/budgets/b1/transactions") == 1
+
+
+# ============================================================================
+# TOKEN REFRESH
+# ============================================================================
+
+async def test_unauthorized_request_retries_with_the_newly_stored_token(
+    make_client, monkeypatch, request
+):
+    monkeypatch.setenv("YNAB_API_TOKEN", "old-token")
+    api.get_token.cache_clear()
+    request.addfinalizer(api.get_token.cache_clear)
+
+    def handler(request):
+        if request.headers["Authorization"] != "Bearer new-token":
+            return error(401, "expired")
+        return ok(budgets=[])
+
+    client, fake = make_client(handler, token=None)
+    monkeypatch.setenv("YNAB_API_TOKEN", "new-token")  # rotated while the client is running
+
+    assert await client.get_budgets() == []
+    assert fake.count("GET", "/budgets") == 2
+    assert api.get_token() == "new-token"
+
+
+# ============================================================================
+# RETRIES
+# ============================================================================
+
+async def test_server_error_on_get_is_retried(make_client):
+    responses = [error(503), ok(budgets=[])]
+    client, fake = make_client(lambda r: responses.pop(0))
+
+    assert await client.get_budgets() == []
+    assert fake.count("GET", "/budgets") == 2
+
+
+async def test_rate_limited_request_is_retried_after_retry_after(make_client):
+    responses = [httpx.Response(429, headers={"Retry-After": "0"}), ok(budgets=[])]
+    client, fake = make_client(lambda r: responses.pop(0))
+
+    assert await client.get_budgets() == []
+    assert fake.count("GET", "/budgets") == 2
+
+
+async def test_gives_up_after_max_retries(make_client):
+    client, fake = make_client(lambda r: error(503, "down"))
+
+    with pytest.raises(YNABAPIError, match="down"):
+        await client.get_budgets()
+    assert fake.count("GET", "/budgets") == api.MAX_RETRIES + 1
+
+
+async def test_client_error_is_not_retried(make_client):
+    client, fake = make_client(lambda r: error(404, "no such category"))
+
+    with pytest.raises(YNABAPIError) as excinfo:
+        await client.get_category("b1", "c1")
+    assert excinfo.value.status_code == 404
+    assert fake.count("GET", CATEGORY_PATH) == 1
+
+
+async def test_server_error_on_post_is_not_retried(make_client):
+    client, fake = make_client(lambda r: error(500))
+
+    with pytest.raises(YNABAPIError):
+        await client.create_transactions("b1", [{"account_id": "a1", "amount": 1}])
+    assert fake.count("POST", "/budgets/b1/transactions") == 1
+
+
+# ============================================================================
+# RATE LIMITING
+# ============================================================================
+
+def test_rate_limit_never_exceeds_the_hourly_quota():
+    # A token bucket admits at most capacity + refill * window requests in any window
+    assert api.RATE_LIMIT_CAPACITY + api.RATE_LIMIT_REFILL * 3600 <= api.RATE_LIMIT_PER_HOUR
+
+
+async def test_rate_limiter_allows_a_burst_then_waits_for_refill():
+    limiter = api._RateLimiter(capacity=2, refill_rate=50)
+
+    start = time.monotonic()
+    await limiter.acquire()
+    await limiter.acquire()
+    burst = time.monotonic() - start
+    await limiter.acquire()
+    total = time.monotonic() - start
+
+    # The first two tokens are already in the bucket; the third takes 1/50 s to refill
+    assert total - burst >= 0.015
+
+
+# ============================================================================
+# TRANSACTION BATCHING
+# ============================================================================
+
+TXN_PATH = "/budgets/b1/transactions"
+
+
+def create_handler(reject_amount=None, reverse=False):
+    """Create transactions as posted; a bulk or single POST with reject_amount gets a 400."""
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        body = json.loads(request.content)
+        posted = body["transactions"] if "transactions" in body else [body["transaction"]]
+        if any(t["amount"] == reject_amount for t in posted):
+            return error(400, "invalid amount")
+        created = [{"id": f"id{t['amount']}", **t} for t in posted]
+        if "transaction" in body:
+            return ok(201, transaction=created[0])
+        return ok(201, transactions=created[::-1] if reverse else created)
+    return handler
+
+
+def create(client, amount):
+    return client.create_transaction("b1", "a1", amount, "2026-01-01")
+
+
+async def test_lone_create_is_sent_immediately(make_client):
+    client, fake = make_client(create_handler())
+
+    created = await create(client, 1)
+
+    assert created["id"] == "id1"
+    assert "transaction" in json.loads(fake.requests[0].content)
+
+
+async def test_creates_arriving_while_one_is_in_flight_share_one_request(make_client):
+    client, fake = make_client(create_handler(reverse=True))
+
+    results = await asyncio.gather(*(create(client, amount) for amount in (1, 2, 3, 4)))
+
+    # Results come back reversed; each caller still gets its own
+    assert [r["id"] for r in results] == ["id1", "id2", "id3", "id4"]
+    bodies = [json.loads(r.content) for r in fake.requests]
+    assert bodies[0] == {"transaction": bodies[0]["transaction"]}
+    assert [t["amount"] for t in bodies[1]["transactions"]] == [2, 3, 4]
+    assert fake.count("POST", TXN_PATH) == 2
+
+
+async def test_rejected_batch_only_fails_the_invalid_create(make_client):
+    client, _ = make_client(create_handler(reject_amount=3))
+
+    results = await asyncio.gather(
+        *(create(client, amount) for amount in (1, 2, 3, 4)), return_exceptions=True
+    )
+
+    assert [r["id"] for r in results if isinstance(r, dict)] == ["id1", "id2", "id4"]
+    assert isinstance(results[2], YNABAPIError)
+
+
+async def test_batch_failing_with_server_error_is_not_resent(make_client):
+    def handler(request):
+        if "transactions" in json.loads(request.content):
+            return error(500, "down")
+        return ok(201, transaction={"id": "id1"})
+
+    async def slow_handler(request):
+        await asyncio.sleep(0.01)
+        return handler(request)
+
+    client, fake = make_client(slow_handler)
+
+    results = await asyncio.gather(
+        *(create(client, amount) for amount in (1, 2, 3)), return_exceptions=True
+    )
+
+    assert results[0] == {"id": "id1"}
+    assert all(isinstance(r, YNABAPIError) for r in results[1:])
+    assert fake.count("POST", TXN_PATH) == 2
+
+
+async def test_create_missing_from_bulk_response_fails_alone(make_client):
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        body = json.loads(request.content)
+        if "transaction" in body:
+            return ok(201, transaction={"id": "first", **body["transaction"]})
+        return ok(201, transactions=[{"id": "id2", **body["transactions"][0]}])
+
+    client, _ = make_client(handler)
+
+    results = await asyncio.gather(
+        *(create(client, amount) for amount in (1, 2, 3)), return_exceptions=True
+    )
+
+    assert results[1]["id"] == "id2"
+    assert isinstance(results[2], YNABAPIError)
+
+
+async def test_close_sends_queued_creates(make_client):
+    client, fake = make_client(create_handler())
+
+    tasks = [asyncio.create_task(create(client, amount)) for amount in (1, 2)]
+    await asyncio.sleep(0)
+    await client.close()
+
+    assert [(await t)["id"] for t in tasks] == ["id1", "id2"]
+    assert fake.count("POST", TXN_PATH) == 2
+
+
+async def test_interrupted_batch_fails_waiters_with_api_error(make_client):
+    client, _ = make_client(create_handler())
+
+    tasks = [asyncio.create_task(create(client, amount)) for amount in (1, 2, 3)]
+    # Let the first create finish and the batch behind it go out
+    await asyncio.sleep(0.015)
+    for flush in list(client._flush_tasks):
+        flush.cancel()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert results[0]["id"] == "id1"
+    assert all(isinstance(r, YNABAPIError) and "interrupted" in str(r) for r in results[1:])
@@ -0,0 +1,172 @@
+"""Tests for the MCP tool handlers and formatting helpers."""
+
+import json
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from ynab_mcp_server import api, server
+from ynab_mcp_server.models import (
+    GetSnapshotInput,
+    GetTransactionsInput,
+    MoveMoneyCategoryInput,
+)
+
+
+def ok(**data) -> httpx.Response:
+    """A successful YNAB response wrapping `data`."""
+    return httpx.Response(200, json={"data": data})
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def test_format_currency_rounds_half_cents_away_from_zero():
+    assert server.format_currency(0) == "$0.00"
+    assert server.format_currency(1234567) == "$1,234.57"
+    assert server.format_currency(2005) == "$2.01"
+    assert server.format_currency(-2005) == "$-2.01"
+    assert server.format_currency(-999995) == "$-1,000.00"
+
+
+def test_dollars_to_milliunits_is_exact():
+    assert server.dollars_to_milliunits(45.67) == 45670
+    assert server.dollars_to_milliunits(-0.01) == -10
+    assert server.dollars_to_milliunits(0.29) == 290  # 0.29 * 1000 is 289.99999999999994
+
+
+def test_transaction_rows_fill_in_missing_and_null_fields():
+    transaction = {"date": "2026-01-02", "payee_name": None, "amount": -1500}
+
+    rows = "".join(server.transaction_rows([transaction]))
+
+    assert "| 2026-01-02 | Unknown | Uncategorized | $-1.50 | ○ |" in rows
+    assert "**Total: $-1.50** (1 transactions)" in rows
+    assert transaction == {"date": "2026-01-02", "payee_name": None, "amount": -1500}
+
+
+# ============================================================================
+# SNAPSHOT TOOL
+# ============================================================================
+
+def snapshot_handler(request):
+    path = request.url.path
+    if path.endswith("/accounts"):
+        return ok(accounts=[{"id": "a1", "name": "Checking", "type": "checking", "balance": 250000}])
+    if path.endswith("/categories"):
+        return ok(category_groups=[{
+            "name": "Bills",
+            "categories": [{"id": "c1", "name": "Rent", "budgeted": 100000, "activity": -100000, "balance": 0}],
+        }])
+    return ok(month={
+        "month": "2026-01-01", "income": 300000, "budgeted": 100000, "activity": -100000,
+        "to_be_budgeted": 200000,
+        "categories": [{"name": "Dining", "balance": -5000}],
+    })
+
+
+async def test_snapshot_fetches_all_sections_in_one_call(make_client, make_ctx):
+    client, fake = make_client(snapshot_handler)
+
+    result = await server.ynab_get_snapshot(GetSnapshotInput(budget_id="b1"), make_ctx(client))
+
+    assert "## Budget Summary for 2026-01-01" in result
+    assert "- **Dining**: $-5.00" in result
+    assert "- **Checking**: $250.00" in result
+    assert "| Rent | $100.00 | $-100.00 | $0.00 |" in result
+    assert len(fake.requests) == 3
+
+
+async def test_snapshot_reports_the_failing_request(make_client, make_ctx):
+    def handler(request):
+        if request.url.path.endswith("/categories"):
+            return httpx.Response(404, json={"error": {"detail": "budget not found"}})
+        return snapshot_handler(request)
+
+    client, _ = make_client(handler)
+
+    result = await server.ynab_get_snapshot(GetSnapshotInput(budget_id="b1"), make_ctx(client))
+
+    assert result == "Error: Resource not found: budget not found"
+
+
+# ============================================================================
+# TRANSACTIONS TOOL
+# ============================================================================
+
+async def test_get_transactions_json_format_returns_raw_objects(make_client, make_ctx, monkeypatch):
+    monkeypatch.setattr(api, "ijson", None)  # read through the cache rather than streaming
+    transaction = {"id": "t1", "date": "2026-01-02", "amount": -1000, "payee_name": None}
+    client, _ = make_client(lambda r: ok(transactions=[transaction]))
+    ctx = make_ctx(client)
+
+    # Rendering markdown first must not leave defaults in the cached payload
+    await server.ynab_get_transactions(GetTransactionsInput(budget_id="b1"), ctx)
+    result = await server.ynab_get_transactions(
+        GetTransactionsInput(budget_id="b1", format="json"), ctx
+    )
+
+    assert json.loads(result) == [transaction]
+
+
+# ============================================================================
+# MOVE MONEY
+# ============================================================================
+
+def move_money_handler(fail_patches: set):
+    """Categories "from" and "to" with $100 each; PATCHes numbered in fail_patches get a 400."""
+    patches = []
+
+    def handler(request):
+        category_id = request.url.path.rsplit("/", 1)[1]
+        if request.method == "GET":
+            return ok(category={"id": category_id, "name": category_id.title(), "budgeted": 100000})
+        patches.append((category_id, json.loads(request.content)["category"]["budgeted"]))
+        if len(patches) in fail_patches:
+            return httpx.Response(400, json={"error": {"detail": "rejected"}})
+        return ok(category={"id": category_id})
+
+    return handler, patches
+
+
+MOVE = MoveMoneyCategoryInput(
+    budget_id="b1", from_category_id="from", to_category_id="to", amount=10, month="2026-01-01"
+)
+
+
+async def test_move_money_updates_both_categories(make_client, make_ctx):
+    handler, patches = move_money_handler(fail_patches=set())
+    client, _ = make_client(handler)
+
+    result = await server.ynab_move_money(MOVE, make_ctx(client))
+
+    assert "**Moved $10.00** from From to To" in result
+    assert sorted(patches) == [("from", 90000), ("to", 110000)]
+
+
+async def test_move_money_rolls_back_when_one_side_fails(make_client, make_ctx):
+    handler, patches = move_money_handler(fail_patches={2})
+    client, _ = make_client(handler)
+
+    result = await server.ynab_move_money(MOVE, make_ctx(client))
+
+    assert result == "Error: API error 400: rejected"
+    assert patches[-1] == ("from", 100000)
+
+
+async def test_move_money_reports_a_failed_rollback(make_client, make_ctx):
+    handler, _ = move_money_handler(fail_patches={2, 3})
+    client, _ = make_client(handler)
+
+    result = await server.ynab_move_money(MOVE, make_ctx(client))
+
+    assert result.startswith("Error: API error 400: rejected")
+    assert "From was applied but could not be undone" in result
+    assert "$90.00 instead of $100.00" in result
+
+
+def test_move_money_rejects_the_same_category_on_both_sides():
+    with pytest.raises(ValidationError, match="must be different"):
+        MoveMoneyCategoryInput(from_category_id="c1", to_category_id="c1", amount=10)